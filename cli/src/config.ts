@@ -115,6 +115,16 @@ function resolveCacheDir(cwd: string): string {
   }
 }
 
+/**
+ * Cache directory chosen by the last getEnv() call, falling back to the workspace cache
+ */
+export function resolveActiveCacheDir(): string {
+  if (process.env.PLGIN_ACTIVE_CACHE_DIR) {
+    return process.env.PLGIN_ACTIVE_CACHE_DIR;
+  }
+  return join(process.cwd(), '.plgin', 'cache');
+}
+
 export const getEnv = () => {
   const cwd = process.cwd();
   const cacheDir = resolveCacheDir(cwd);
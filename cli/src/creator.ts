@@ -382,8 +382,7 @@ async function materializePack(pack: Pack, options: {
   try {
     const proxyUrl = getRegistryEndpoint();
     const entries: RegistryEntry[] = await fetchRegistryFromProxy(proxyUrl);
-    const existing = entries.find(e => e.name === normalizedName);
-    if (existing) {
+    if (entries.some(e => e.name === normalizedName)) {
       const suffix = randomUUID().slice(0, 8);
       normalizedName += `-${suffix}`;
       console.log(`Name conflict detected with existing pack, using unique name: ${normalizedName}`);
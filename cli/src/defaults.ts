@@ -8,6 +8,12 @@
  * - Users only need OPENROUTER_API_KEY for AI operations
  */
 
+/**
+ * User-Agent sent on every proxy and registry request; the proxy uses it to
+ * recognise CLI traffic
+ */
+export const PLGIN_USER_AGENT = 'plgin-cli/2.0.8';
+
 export const ORG_DEFAULTS = {
   /**
    * Organization name for the pack registry
@@ -2,6 +2,8 @@ import { Octokit } from '@octokit/rest';
 import { createHash } from 'node:crypto';
 import type { RegistryEntry } from './types.js';
 
+const REGISTRY_REPO = 'plgin-registry';
+
 export interface GitHubClientOptions {
   token: string;
   org: string;
@@ -20,7 +22,7 @@ export class GitHubClient {
     try {
       const { data } = await this.octokit.repos.getContent({
         owner: this.org,
-        repo: 'plgin-registry',
+        repo: REGISTRY_REPO,
         path: 'registry.json'
       });
 
@@ -45,14 +47,14 @@ export class GitHubClient {
     try {
       const { data: existingFile } = await this.octokit.repos.getContent({
         owner: this.org,
-        repo: 'plgin-registry',
+        repo: REGISTRY_REPO,
         path
       });
 
       if ('sha' in existingFile) {
         await this.octokit.repos.createOrUpdateFileContents({
           owner: this.org,
-          repo: 'plgin-registry',
+          repo: REGISTRY_REPO,
           path,
           message,
           content: Buffer.from(content).toString('base64'),
@@ -63,7 +65,7 @@ export class GitHubClient {
       if (error.status === 404) {
         await this.octokit.repos.createOrUpdateFileContents({
           owner: this.org,
-          repo: 'plgin-registry',
+          repo: REGISTRY_REPO,
           path,
           message,
           content: Buffer.from(content).toString('base64')
@@ -79,7 +81,7 @@ export class GitHubClient {
 
     const { data: release } = await this.octokit.repos.createRelease({
       owner: this.org,
-      repo: 'plgin-registry',
+      repo: REGISTRY_REPO,
       tag_name: tagName,
       name: `${name} v${version}`,
       body: `Pack release for ${name} v${version}\n\nChecksum (SHA256): \`${checksum}\``
@@ -93,7 +95,7 @@ export class GitHubClient {
 
     const { data: asset } = await this.octokit.repos.uploadReleaseAsset({
       owner: this.org,
-      repo: 'plgin-registry',
+      repo: REGISTRY_REPO,
       release_id: releaseId,
       name: filename,
       data: tarballBuffer as any
@@ -106,13 +108,13 @@ export class GitHubClient {
     try {
       await this.octokit.repos.get({
         owner: this.org,
-        repo: 'plgin-registry'
+        repo: REGISTRY_REPO
       });
     } catch (error: any) {
       if (error.status === 404) {
         await this.octokit.repos.createInOrg({
           org: this.org,
-          name: 'plgin-registry',
+          name: REGISTRY_REPO,
           description: 'PLGN pack registry',
           auto_init: true,
           private: false
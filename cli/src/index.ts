@@ -1,6 +1,7 @@
 #!/usr/bin/env node
 
 import { existsSync } from 'node:fs';
+import { spawn } from 'node:child_process';
 import { basename, resolve, join } from 'node:path';
 import { fileURLToPath } from 'node:url';
 import { createInterface } from 'node:readline/promises';
@@ -26,9 +27,10 @@ import type {
   ChangeSet
 } from './types.js';
 import { createPackFromSource, createPackFromPrompt } from './creator.js';
-import { discoverPacks, publishPack } from './registry.js';
+import { discoverPacks, publishPacks } from './registry.js';
 import { checkCompatibility, integratePack } from './integrator.js';
 import { applyChangeSet } from './utils/diff.js';
+import { installHttpPool } from './utils/http.js';
 import { createAgent } from './agent.js';
 import { createSemanticService } from './semantic.js';
 
@@ -69,6 +71,7 @@ function loadEnvironment(): void {
 }
 
 loadEnvironment();
+installHttpPool();
 
 const program = new Command();
 program
@@ -98,7 +101,6 @@ async function installMissingDependencies(
   console.log(chalk.cyan('Installing dependencies...'));
 
   // Detect package manager
-  const { execSync } = await import('child_process');
   let installCmd = 'npm install';
 
   if (await fsExtra.pathExists(join(projectRoot, 'pnpm-lock.yaml'))) {
@@ -110,9 +112,21 @@ async function installMissingDependencies(
   }
 
   try {
-    execSync(installCmd, {
-      cwd: projectRoot,
-      stdio: 'inherit'
+    // Run the install without blocking the event loop so spinners and pending I/O keep progressing
+    await new Promise<void>((resolveInstall, rejectInstall) => {
+      const child = spawn(installCmd, {
+        cwd: projectRoot,
+        stdio: 'inherit',
+        shell: true
+      });
+      child.on('error', rejectInstall);
+      child.on('close', (code) => {
+        if (code === 0) {
+          resolveInstall();
+        } else {
+          rejectInstall(new Error(`${installCmd} exited with code ${code}`));
+        }
+      });
     });
     console.log(chalk.green(`✓ Dependencies installed`));
   } catch (error) {
@@ -561,21 +575,22 @@ program
   });
 
 program
-  .command('publish <path>')
-  .description('Publish a pack to the registry')
+  .command('publish <paths...>')
+  .description('Publish one or more packs to the registry')
   .option('--registry <url>', 'target registry endpoint')
-  .action(async (path: string, flags) => {
+  .action(async (paths: string[], flags) => {
     try {
       const config = await loadConfig();
       const env = getEnv();
-      const spinner = ora('Publishing pack...').start();
-      await publishPack({
+      const spinner = ora(paths.length > 1 ? `Publishing ${paths.length} packs...` : 'Publishing pack...').start();
+      const params = paths.map((path) => ({
         packDir: path,
         registry: flags.registry,
         config,
         cacheDir: env.cacheDir
-      });
-      spinner.succeed('Pack published');
+      }));
+      await publishPacks(params);
+      spinner.succeed(params.length > 1 ? `${params.length} packs published` : 'Pack published');
     } catch (error) {
       handleError(error);
     }
@@ -1,13 +1,18 @@
 import { join, resolve } from 'node:path';
+import { createWriteStream } from 'node:fs';
+import { Readable } from 'node:stream';
+import { pipeline } from 'node:stream/promises';
+import type { ReadableStream as WebReadableStream } from 'node:stream/web';
 import fsExtra from 'fs-extra';
-const { pathExists, readJson, ensureDir, remove, writeFile } = fsExtra;
+const { pathExists, readJson, ensureDir, remove } = fsExtra;
 import {
   detectLanguageFromPath,
   listFilesRecursive
 } from './utils/fs.js';
 import { buildChangeSetPreview } from './utils/diff.js';
 import { fetchRegistryFromProxy, resolveGitHubToken } from './registry.js';
-import { getRegistryEndpoint } from './defaults.js';
+import { resolveActiveCacheDir } from './config.js';
+import { getRegistryEndpoint, PLGIN_USER_AGENT } from './defaults.js';
 import { extract } from 'tar';
 import type {
   CompatibilityOptions,
@@ -28,13 +33,6 @@ export async function checkCompatibility(options: CompatibilityOptions): Promise
   return computeCompatibility(pack, options.targetLanguage);
 }
 
-function resolveActiveCacheDir(): string {
-  if (process.env.PLGIN_ACTIVE_CACHE_DIR) {
-    return process.env.PLGIN_ACTIVE_CACHE_DIR;
-  }
-  return join(process.cwd(), '.plgin', 'cache');
-}
-
 const INTEGRATION_TOOLS: ToolDefinition[] = [
   {
     type: 'function',
@@ -464,22 +462,27 @@ async function downloadPackFromRegistry(ref: string): Promise<string> {
   }
 
   const token = resolveGitHubToken();
-  const headers: Record<string, string> = { 'User-Agent': 'plgin-cli/2.0.8' };
+  const headers: Record<string, string> = { 'User-Agent': PLGIN_USER_AGENT };
   if (token) {
     headers['Authorization'] = `token ${token}`;
   }
 
   const response = await fetch(targetEntry.downloadUrl, { headers });
-  if (!response.ok) {
+  if (!response.ok || !response.body) {
     throw new Error(`Failed to download pack: ${response.status} ${response.statusText}`);
   }
-  const buffer = Buffer.from(await response.arrayBuffer());
 
   const tempDir = join(process.env.TMPDIR || '/tmp', `plgin-${targetEntry.name}-${Date.now()}`);
   await ensureDir(tempDir);
 
+  // Stream the tarball straight to disk instead of buffering and copying it in memory
   const tempTarPath = join(tempDir, `${targetEntry.name}.tgz`);
-  await writeFile(tempTarPath, buffer);
+  try {
+    await pipeline(Readable.fromWeb(response.body as unknown as WebReadableStream<Uint8Array>), createWriteStream(tempTarPath));
+  } catch (error) {
+    await remove(tempDir);
+    throw new Error(`Failed to download pack: ${error instanceof Error ? error.message : String(error)}`);
+  }
 
   try {
     await extract({
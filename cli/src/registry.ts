@@ -1,13 +1,13 @@
 import fsExtra from 'fs-extra';
-const { readJson, writeJson, ensureDir, pathExists, readFile } = fsExtra;
-import { join } from 'node:path';
+const { readJson, writeJson, ensureDir, pathExists } = fsExtra;
+import { join, dirname } from 'node:path';
 import { create as createTarball } from 'tar';
 import { GitHubClient } from './github.js';
 import { validatePackStructure, generateComplianceReport } from './lifecycle.js';
 import { createSemanticService } from './semantic.js';
 import { getEnv } from './config.js';
 import { listFilesRecursive } from './utils/fs.js';
-import { getRegistryEndpoint } from './defaults.js';
+import { getRegistryEndpoint, PLGIN_USER_AGENT } from './defaults.js';
 import type {
   RegistryPackSummary,
   RegistryEntry,
@@ -20,6 +20,19 @@ import type {
 
 
 const LOCAL_REGISTRY_PATH = join(process.cwd(), '.plgin', 'registry.json');
+const REGISTRY_INDEX_CACHE_FILE = 'registry-index.json';
+const REGISTRY_MEMORY_TTL_MS = 30_000;
+const MAX_TARBALL_BYTES = 100 * 1024 * 1024;
+
+interface CachedRegistryIndex {
+  etag?: string;
+  entries: RegistryEntry[];
+  fetchedAt: string;
+}
+
+// Decoded registry entries kept for the life of the process so that create,
+// apply and publish flows don't refetch the index several times per command.
+let registryMemoryCache: { proxyUrl: string; entries: RegistryEntry[]; expires: number } | null = null;
 
 export function resolveGitHubToken(): string | undefined {
   return process.env.GITHUB_TOKEN || process.env.GH_TOKEN;
@@ -47,33 +60,95 @@ async function discoverFromProxy(
   config: ConfigFile,
   semantic: ReturnType<typeof createSemanticService>
 ): Promise<RegistryPackSummary[]> {
-  const cacheDir = process.env.PLGIN_ACTIVE_CACHE_DIR || join(process.cwd(), '.plgin', 'cache');
-  const cacheFile = join(cacheDir, `registry-${Date.now()}.json`);
-
   const proxyUrl = getRegistryEndpoint();
   const entries = await fetchRegistryFromProxy(proxyUrl);
 
-  await ensureDir(cacheDir);
-  await writeJson(cacheFile, { timestamp: Date.now(), entries }, { spaces: 2 });
-
   const filtered = filterByLanguage(entries, options.language);
   const prioritized = await prioritizeEntries(filtered, options.query, options.language, semantic);
   return prioritized.map((entry) => toSummary(entry, config));
 }
 
 export async function fetchRegistryFromProxy(proxyUrl: string): Promise<RegistryEntry[]> {
-  const response = await fetch(`${proxyUrl}/registry/index`, {
-    headers: {
-      'User-Agent': 'plgin-cli/2.0.8'
-    }
-  });
+  if (registryMemoryCache && registryMemoryCache.proxyUrl === proxyUrl && Date.now() < registryMemoryCache.expires) {
+    return registryMemoryCache.entries;
+  }
+
+  const entries = await fetchRegistryIndex(proxyUrl);
+  registryMemoryCache = { proxyUrl, entries, expires: Date.now() + REGISTRY_MEMORY_TTL_MS };
+  return entries;
+}
+
+function invalidateRegistryMemoryCache(): void {
+  registryMemoryCache = null;
+}
+
+async function fetchRegistryIndex(proxyUrl: string): Promise<RegistryEntry[]> {
+  // Only use a cache dir that getEnv() has resolved. Falling back to cwd would create
+  // .plgin/ in the user's project, which opts every later command into workspace caching.
+  const cacheDir = process.env.PLGIN_ACTIVE_CACHE_DIR;
+  const cachePath = cacheDir ? join(cacheDir, REGISTRY_INDEX_CACHE_FILE) : undefined;
+  const cached = cachePath ? await readCachedRegistryIndex(cachePath) : null;
+
+  const headers: Record<string, string> = {
+    'User-Agent': PLGIN_USER_AGENT
+  };
+  if (cached?.etag) {
+    headers['If-None-Match'] = cached.etag;
+  }
+
+  const response = await fetch(`${proxyUrl}/registry/index`, { headers });
+
+  // Unchanged since our last fetch: reuse the cached entries, no body transferred
+  if (response.status === 304 && cached) {
+    return cached.entries;
+  }
+
+  // Rate-limited by the proxy: serve the last known index rather than failing or retrying
+  if (response.status === 429 && cached) {
+    console.warn(`Registry proxy rate limit reached; using cached index from ${cached.fetchedAt}`);
+    return cached.entries;
+  }
 
   if (!response.ok) {
     throw new Error(`Failed to fetch registry from proxy: ${response.statusText}`);
   }
 
-  const data = await response.json() as { entries: RegistryEntry[]; cached_at: string };
-  return data.entries;
+  // The proxy may answer with its JSON envelope or redirect to the raw registry.json
+  // on GitHub's CDN, which is a bare array of entries
+  const data = await response.json() as { entries: RegistryEntry[]; cached_at: string } | RegistryEntry[];
+  const entries = Array.isArray(data) ? data : data.entries;
+
+  if (cachePath) {
+    await writeCachedRegistryIndex(cachePath, {
+      etag: response.headers.get('etag') ?? undefined,
+      entries,
+      fetchedAt: new Date().toISOString()
+    });
+  }
+
+  return entries;
+}
+
+async function readCachedRegistryIndex(cachePath: string): Promise<CachedRegistryIndex | null> {
+  try {
+    if (!(await pathExists(cachePath))) {
+      return null;
+    }
+    const cached = (await readJson(cachePath)) as CachedRegistryIndex;
+    return Array.isArray(cached?.entries) ? cached : null;
+  } catch {
+    return null;
+  }
+}
+
+async function writeCachedRegistryIndex(cachePath: string, cached: CachedRegistryIndex): Promise<void> {
+  try {
+    await ensureDir(dirname(cachePath));
+    // Machine-only cache: skip pretty-printing, which grows with registry size
+    await writeJson(cachePath, cached);
+  } catch (error) {
+    console.warn(`Failed to persist registry cache: ${error instanceof Error ? error.message : String(error)}`);
+  }
 }
 
 async function discoverFromLocal(
@@ -88,6 +163,42 @@ async function discoverFromLocal(
 }
 
 export async function publishPack(params: PublishPackParams): Promise<PublishResult> {
+  const result = await publishPackToProxy(params);
+  await refreshLocalRegistry();
+  return result;
+}
+
+/**
+ * Publish several packs in one run. Each pack is uploaded in turn, but the
+ * registry index is re-read and persisted locally only once at the end.
+ */
+export async function publishPacks(paramsList: PublishPackParams[]): Promise<PublishResult[]> {
+  const results: PublishResult[] = [];
+  const published: string[] = [];
+  try {
+    for (const params of paramsList) {
+      try {
+        results.push(await publishPackToProxy(params));
+        published.push(params.packDir);
+      } catch (error) {
+        const message = error instanceof Error ? error.message : String(error);
+        const already = published.length ? ` (already published: ${published.join(', ')})` : '';
+        throw new Error(`Failed to publish ${params.packDir}: ${message}${already}`);
+      }
+    }
+  } finally {
+    if (results.length > 0) {
+      try {
+        await refreshLocalRegistry();
+      } catch (error) {
+        console.warn(`Failed to refresh local registry: ${error instanceof Error ? error.message : String(error)}`);
+      }
+    }
+  }
+  return results;
+}
+
+async function publishPackToProxy(params: PublishPackParams): Promise<PublishResult> {
   console.log('Publishing pack to registry via proxy...');
 
   const validation = await validatePackStructure(params.packDir);
@@ -102,20 +213,26 @@ export async function publishPack(params: PublishPackParams): Promise<PublishRes
     }
   }
 
-  await generateComplianceReport(params.packDir);
-
   const manifestPath = join(params.packDir, 'manifest.json');
   const manifest = (await readJson(manifestPath)) as PackManifest;
 
-  // Check semantic similarity before publishing
-  const similarity = await checkSimilarity(manifest);
+  // Check semantic similarity before publishing. The check is a proxy round-trip
+  // and never throws, so overlap it with the local compliance report and tarball.
+  const similarityCheck = checkSimilarity(manifest);
+
+  await generateComplianceReport(params.packDir);
+  const tarballBuffer = await createPackTarball(params.packDir);
+  // Fail before base64-encoding: the encoded body is ~4/3 the size and would be rejected anyway
+  if (tarballBuffer.length > MAX_TARBALL_BYTES) {
+    throw new Error(`Pack tarball is ${(tarballBuffer.length / (1024 * 1024)).toFixed(1)} MB, exceeding the ${MAX_TARBALL_BYTES / (1024 * 1024)} MB publish limit. Remove large or generated files from the pack and try again.`);
+  }
+
+  const similarity = await similarityCheck;
   if (similarity.similar) {
     throw new Error(`Pack too similar to existing pack "${similarity.similarPack}" (similarity score: ${similarity.maxScore.toFixed(3)}). Please modify the description/tags or rename the pack to publish.`);
   }
   console.log(`Similarity check passed (max score: ${similarity.maxScore.toFixed(3)})`);
 
-  const tarballBuffer = await createPackTarball(params.packDir, manifest.name, manifest.version);
-
   const proxyUrl = getRegistryEndpoint();
   const author = process.env.GIT_AUTHOR_NAME || 'community';
 
@@ -123,7 +240,7 @@ export async function publishPack(params: PublishPackParams): Promise<PublishRes
     method: 'POST',
     headers: {
       'Content-Type': 'application/json',
-      'User-Agent': 'plgin-cli/2.0.8'
+      'User-Agent': PLGIN_USER_AGENT
     },
     body: JSON.stringify({
       name: manifest.name,
@@ -149,16 +266,20 @@ export async function publishPack(params: PublishPackParams): Promise<PublishRes
     downloadUrl: string;
   };
 
-  const proxyReadUrl = getRegistryEndpoint();
-  const registryResponse = await fetch(`${proxyReadUrl}/registry/index`, {
-    headers: {
-      'User-Agent': 'plgin-cli/2.0.8'
-    }
-  });
+  await maybeIndexPackSemantics(params, manifest);
+
+  return {
+    url: result.url,
+    version: result.version,
+    checksum: result.checksum
+  };
+}
 
-  if (registryResponse.ok) {
-    const registryData = await registryResponse.json() as { entries: RegistryEntry[] };
-    const localSummaries = registryData.entries.map((e) => ({
+async function refreshLocalRegistry(): Promise<void> {
+  invalidateRegistryMemoryCache();
+  const registryEntries = await fetchRegistryFromProxy(getRegistryEndpoint()).catch(() => null);
+  if (registryEntries) {
+    const localSummaries = registryEntries.map((e) => ({
       name: e.name,
       version: e.version,
       languages: e.languages,
@@ -167,14 +288,6 @@ export async function publishPack(params: PublishPackParams): Promise<PublishRes
     }));
     await persistLocalRegistry(localSummaries);
   }
-
-  await maybeIndexPackSemantics(params, manifest);
-
-  return {
-    url: result.url,
-    version: result.version,
-    checksum: result.checksum
-  };
 }
 
 async function maybeIndexPackSemantics(params: PublishPackParams, manifest: PackManifest): Promise<void> {
@@ -200,20 +313,22 @@ async function maybeIndexPackSemantics(params: PublishPackParams, manifest: Pack
   });
 }
 
-async function createPackTarball(packDir: string, name: string, version: string): Promise<Buffer> {
-  const tarballPath = `/tmp/${name}-${version}.tgz`;
-
-  await createTarball(
+async function createPackTarball(packDir: string): Promise<Buffer> {
+  // Collect the gzip stream in memory rather than writing to /tmp and reading it back
+  const chunks: Buffer[] = [];
+  const stream = createTarball(
     {
       gzip: true,
-      file: tarballPath,
       cwd: packDir
     },
     ['.']
   );
 
-  const buffer = await readFile(tarballPath);
-  return buffer;
+  for await (const chunk of stream) {
+    chunks.push(chunk as Buffer);
+  }
+
+  return Buffer.concat(chunks);
 }
 
 async function queryLocalRegistry(): Promise<RegistryPackSummary[]> {
@@ -330,7 +445,7 @@ async function checkSimilarity(manifest: PackManifest): Promise<{ similar: boole
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
-        'User-Agent': 'plgin-cli/2.0.8'
+        'User-Agent': PLGIN_USER_AGENT
       },
       body: JSON.stringify(payload)
     });
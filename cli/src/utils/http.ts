@@ -0,0 +1,34 @@
+import { Agent, setGlobalDispatcher } from 'undici';
+
+let pooledDispatcherInstalled = false;
+
+function hasProxyConfigured(): boolean {
+  return Boolean(
+    process.env.HTTPS_PROXY
+    ?? process.env.https_proxy
+    ?? process.env.HTTP_PROXY
+    ?? process.env.http_proxy
+  );
+}
+
+/**
+ * Install a shared keep-alive connection pool for all fetch() calls.
+ *
+ * Registry, semantic and release-download requests all go through global fetch.
+ * The default dispatcher drops idle sockets after 4s, so calls separated by an
+ * LLM round-trip pay a fresh TCP+TLS handshake each time. When an HTTPS proxy is
+ * configured the agent installs its own ProxyAgent instead, so we leave it alone.
+ */
+export function installHttpPool(): void {
+  if (pooledDispatcherInstalled || hasProxyConfigured()) {
+    return;
+  }
+
+  setGlobalDispatcher(new Agent({
+    connections: 100,
+    keepAliveTimeout: 30_000,
+    keepAliveMaxTimeout: 60_000,
+    connect: { timeout: 10_000 }
+  }));
+  pooledDispatcherInstalled = true;
+}
@@ -0,0 +1,134 @@
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import { join } from 'node:path';
+import { mkdtemp, rm, writeFile, readFile, readdir } from 'node:fs/promises';
+import { tmpdir } from 'node:os';
+import { fetchRegistryFromProxy } from '../cli/src/registry.js';
+import type { RegistryEntry } from '../cli/src/types.js';
+
+const ENTRY: RegistryEntry = {
+  name: 'auth-system',
+  version: '1.0.0',
+  languages: ['typescript'],
+  description: 'Authentication pack',
+  downloadUrl: 'https://example.com/auth-system-1.0.0.tgz',
+  checksum: 'abc123',
+  publishedAt: '2025-10-05T00:00:00.000Z',
+  author: 'community'
+};
+
+const CACHED_ENTRY: RegistryEntry = { ...ENTRY, version: '0.9.0' };
+
+describe('fetchRegistryFromProxy', () => {
+  let cacheDir: string;
+  let fetchMock: ReturnType<typeof vi.fn>;
+  let previousCacheDir: string | undefined;
+  let proxyCounter = 0;
+
+  // The in-memory TTL cache is keyed by proxy URL, so each test uses its own
+  const nextProxyUrl = () => `https://proxy-${++proxyCounter}.test`;
+  const cachePath = () => join(cacheDir, 'registry-index.json');
+  const sentHeaders = () => (fetchMock.mock.calls[0][1] as { headers: Record<string, string> }).headers;
+
+  async function writeCache(contents: string): Promise<void> {
+    await writeFile(cachePath(), contents, 'utf8');
+  }
+
+  beforeEach(async () => {
+    cacheDir = await mkdtemp(join(tmpdir(), 'plgin-registry-test-'));
+    previousCacheDir = process.env.PLGIN_ACTIVE_CACHE_DIR;
+    process.env.PLGIN_ACTIVE_CACHE_DIR = cacheDir;
+    fetchMock = vi.fn();
+    vi.stubGlobal('fetch', fetchMock);
+    vi.spyOn(console, 'warn').mockImplementation(() => {});
+  });
+
+  afterEach(async () => {
+    vi.unstubAllGlobals();
+    vi.restoreAllMocks();
+    if (previousCacheDir === undefined) {
+      delete process.env.PLGIN_ACTIVE_CACHE_DIR;
+    } else {
+      process.env.PLGIN_ACTIVE_CACHE_DIR = previousCacheDir;
+    }
+    await rm(cacheDir, { recursive: true, force: true });
+  });
+
+  it('reads the proxy envelope and caches it with the ETag', async () => {
+    fetchMock.mockResolvedValue(new Response(JSON.stringify({ entries: [ENTRY], cached_at: 'now' }), {
+      status: 200,
+      headers: { 'content-type': 'application/json', etag: '"v1"' }
+    }));
+
+    const entries = await fetchRegistryFromProxy(nextProxyUrl());
+
+    expect(entries).toEqual([ENTRY]);
+    expect(sentHeaders()['If-None-Match']).toBeUndefined();
+    const cached = JSON.parse(await readFile(cachePath(), 'utf8'));
+    expect(cached.etag).toBe('"v1"');
+    expect(cached.entries).toEqual([ENTRY]);
+  });
+
+  it('accepts a bare array of entries from the raw registry.json', async () => {
+    fetchMock.mockResolvedValue(new Response(JSON.stringify([ENTRY]), {
+      status: 200,
+      headers: { 'content-type': 'application/json' }
+    }));
+
+    await expect(fetchRegistryFromProxy(nextProxyUrl())).resolves.toEqual([ENTRY]);
+  });
+
+  it('returns cached entries on 304', async () => {
+    await writeCache(JSON.stringify({ etag: '"v0"', entries: [CACHED_ENTRY], fetchedAt: 'earlier' }));
+    fetchMock.mockResolvedValue(new Response(null, { status: 304 }));
+
+    const entries = await fetchRegistryFromProxy(nextProxyUrl());
+
+    expect(entries).toEqual([CACHED_ENTRY]);
+    expect(sentHeaders()['If-None-Match']).toBe('"v0"');
+  });
+
+  it('returns cached entries when the proxy rate-limits', async () => {
+    await writeCache(JSON.stringify({ etag: '"v0"', entries: [CACHED_ENTRY], fetchedAt: 'earlier' }));
+    fetchMock.mockResolvedValue(new Response(null, { status: 429, statusText: 'Too Many Requests' }));
+
+    await expect(fetchRegistryFromProxy(nextProxyUrl())).resolves.toEqual([CACHED_ENTRY]);
+  });
+
+  it('throws on 429 when nothing is cached', async () => {
+    fetchMock.mockResolvedValue(new Response(null, { status: 429, statusText: 'Too Many Requests' }));
+
+    await expect(fetchRegistryFromProxy(nextProxyUrl())).rejects.toThrow('Too Many Requests');
+  });
+
+  it('does not persist anything under cwd when no cache dir is active', async () => {
+    const workDir = await mkdtemp(join(tmpdir(), 'plgin-registry-cwd-'));
+    const cwdSpy = vi.spyOn(process, 'cwd').mockReturnValue(workDir);
+    delete process.env.PLGIN_ACTIVE_CACHE_DIR;
+    fetchMock.mockResolvedValue(new Response(JSON.stringify({ entries: [ENTRY], cached_at: 'now' }), {
+      status: 200,
+      headers: { 'content-type': 'application/json', etag: '"v1"' }
+    }));
+
+    try {
+      await expect(fetchRegistryFromProxy(nextProxyUrl())).resolves.toEqual([ENTRY]);
+      expect(sentHeaders()['If-None-Match']).toBeUndefined();
+      expect(await readdir(workDir)).toEqual([]);
+    } finally {
+      cwdSpy.mockRestore();
+      await rm(workDir, { recursive: true, force: true });
+    }
+  });
+
+  it('ignores an unreadable cache file and fetches unconditionally', async () => {
+    await writeCache('{not json');
+    fetchMock.mockResolvedValue(new Response(JSON.stringify({ entries: [ENTRY], cached_at: 'now' }), {
+      status: 200,
+      headers: { 'content-type': 'application/json' }
+    }));
+
+    const entries = await fetchRegistryFromProxy(nextProxyUrl());
+
+    expect(entries).toEqual([ENTRY]);
+    expect(sentHeaders()['If-None-Match']).toBeUndefined();
+  });
+});